@@ -12,11 +12,13 @@ def list_modules(args):
 
 
 def install_module(args):
-    katanacore.install_module(args.name)
+    for name in args.name:
+        katanacore.install_module(name)
 
 
 def remove_module(args):
-    katanacore.remove_module(args.name)
+    for name in args.name:
+        katanacore.remove_module(name)
 
 
 def start_module(args):
@@ -48,11 +50,11 @@ if __name__ == "__main__":
     list.set_defaults(func=list_modules)
 
     install = subparsers.add_parser('install')
-    install.add_argument('name')
+    install.add_argument('name', nargs='+')
     install.set_defaults(func=install_module)
 
     remove = subparsers.add_parser('remove')
-    remove.add_argument('name')
+    remove.add_argument('name', nargs='+')
     remove.set_defaults(func=remove_module)
 
     start = subparsers.add_parser('start')
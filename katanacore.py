@@ -1,20 +1,31 @@
-from os import listdir, path
-from os.path import isdir, join, dirname, realpath, abspath
+from os import scandir, path
+from os.path import join, dirname, realpath, abspath
 import yaml
 import katanaerrors
 import re
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 module_dict = {}
 locked_modules = []
 lock_file_read = False
 
+_my_path = abspath(dirname(__file__))
+_modules_path = realpath(join(_my_path, "modules"))
+_lock_file = join(_my_path, "katana.lock")
+
+_module_name_re = re.compile(r'[a-zA-Z][a-zA-Z0-9\-_]+')
+
 
 def load_module_info(path):
     with open(path, 'r') as stream:
-        module_info = yaml.load(stream, Loader=yaml.SafeLoader)
+        module_info = yaml.load(stream, Loader=_YamlLoader)
         module_info['path'] = dirname(path)
 
-        if re.fullmatch('[a-zA-Z][a-zA-Z0-9\-_]+', module_info['name']):
+        if _module_name_re.fullmatch(module_info['name']):
             provisioner_class = module_info.get("class", "provisioners.DefaultProvisioner")
             if "." in provisioner_class:
                 class_name = provisioner_class[provisioner_class.rindex(".") + 1:]
@@ -36,21 +47,19 @@ def list_modules(path=None, module_list=None):
     if module_list is None:
         module_list = []
     if path is None:
-        my_path = abspath(dirname(__file__))
-        path = realpath(join(my_path, "modules"))
+        path = _modules_path
 
     if len(module_list) == 0:
         module_dict.clear()
 
-    file_list = listdir(path)
-    for f in file_list:
-        file_path = join(path, f)
-        if isdir(file_path):
-            list_modules(file_path, module_list)
-        elif f.endswith(".yml"):
-            module_info = load_module_info(file_path)
-            if module_info is not None:
-                module_list.append(module_info)
+    with scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                list_modules(entry.path, module_list)
+            elif entry.name.endswith(".yml"):
+                module_info = load_module_info(entry.path)
+                if module_info is not None:
+                    module_list.append(module_info)
     return module_list
 
 
@@ -113,10 +122,7 @@ def lock_modules():
         if status in ['running', 'installed', 'stopped']:
             locked_modules.append(module_name)
 
-    my_path = abspath(dirname(__file__))
-    lock_file = join(my_path, "katana.lock")
-
-    with open(lock_file, 'w') as lf:
+    with open(_lock_file, 'w') as lf:
         lf.write("\n".join(locked_modules))
     lock_file_read = False
 
@@ -126,12 +132,9 @@ def load_locked_modules():
     if lock_file_read:
         return locked_modules
     else:
-        my_path = abspath(dirname(__file__))
-        lock_file = join(my_path, "katana.lock")
-
-        if path.exists(lock_file):
+        if path.exists(_lock_file):
             locked_modules.clear()
-            with open(lock_file, 'r') as lf:
+            with open(_lock_file, 'r') as lf:
                 for module in lf.readlines():
                     locked_modules.append(module.strip())
         else:
@@ -10,11 +10,11 @@ class ModuleNotFound(WTFError):
 
 class NotImplemented(WTFError):
 
-    def __init__(self, name, provisioner):
-        self.message = "Function '{}' is not implemented for the provisioner {}.".format(name, provisioner)
-
-    def __init__(self, name, provisioner, module):
-        self.message = "Function '{}' is not implemented in the module '{}'.".format(name, module)
+    def __init__(self, name, provisioner, module=None):
+        if module is None:
+            self.message = "Function '{}' is not implemented for the provisioner {}.".format(name, provisioner)
+        else:
+            self.message = "Function '{}' is not implemented in the module '{}'.".format(name, module)
 
 
 class MissingFunction(WTFError):
@@ -5,7 +5,7 @@ import os
 def read_repo():
     if os.path.exists("installed.yml"):
         with open("installed.yml", 'r') as stream:
-            return yaml.load(stream)
+            return yaml.safe_load(stream)
     else:
         return {}
 
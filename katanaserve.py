@@ -99,8 +99,10 @@ class KatanaServer(object):
         rows = []
         for module in target_list:
             name = module.get('name')
-            actions = self.render_actions_for_status(module.get('status', 'unknown'), name, module.get('href'), module.get('actions'))
-            rendered_name = self.render_module_name(module.get('status', 'unknown'), name, module.get('href'))
+            status = module.get('status', 'unknown')
+            href = module.get('href')
+            actions = self.render_actions_for_status(status, name, href, module.get('actions'))
+            rendered_name = self.render_module_name(status, name, href)
             rows.append(
                 f'<tr><td id="{name}-name">{rendered_name}</td><td>{module["description"]}</td><td id="{name}-actions">{actions}</td></tr>')
         all_rows = ''.join(rows)
@@ -111,14 +113,13 @@ class KatanaServer(object):
         results = {}
         locked_modules = katanacore.load_locked_modules()
         for module in module_list:
-            if len(locked_modules) == 0 or module.get_name() in locked_modules:
-                if module.get_category() not in results:
-                    results[module.get_category()] = []
-                status = katanacore.status_module(module.get_name())
-
-                results[module.get_category()].append(
-                    {'name': module.get_name(), 'description': module.get_description(), 'status': status,
-                     'href': module.get_href(), 'actions': katanacore.get_available_actions(module.get_name())})
+            name = module.get_name()
+            if len(locked_modules) == 0 or name in locked_modules:
+                status = katanacore.status_module(name)
+
+                results.setdefault(module.get_category(), []).append(
+                    {'name': name, 'description': module.get_description(), 'status': status,
+                     'href': module.get_href(), 'actions': katanacore.get_available_actions(name)})
         for category in results:
             sorted_list = sorted(results[category], key=lambda i: i['name'])
             results[category] = sorted_list
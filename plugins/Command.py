@@ -2,8 +2,6 @@ from plugins import Plugin
 
 import subprocess
 import shlex
-import os.path
-import os
 
 
 class Command(Plugin):
@@ -1,6 +1,7 @@
 from plugins import Plugin
 import os.path
 import os
+import stat
 
 
 class Copy(Plugin):
@@ -9,15 +10,31 @@ class Copy(Plugin):
     def get_aliases(cls):
         return ["copy"]
 
+    @staticmethod
+    def _is_unchanged(dest, st, content, mode=None):
+        if mode is not None and stat.S_IMODE(st.st_mode) != mode:
+            return False
+        # A size mismatch settles it without reading the file back.
+        if st.st_size != len(content):
+            return False
+        with open(dest, 'rb') as in_file:
+            return in_file.read() == content
+
     def any(self, params):
         self._validate_params(params, ['dest', 'content'], 'copy')
-        if not params.get("force", False) and os.path.exists(params.get("dest")):
-            return False, "The specified destination path exists: {}".format(params.get("dest"))
-        else:
-            with open(params.get("dest"), 'w') as out_file:
-                out_file.write(params.get('content'))
-                if "mode" in params:
-                    os.chmod(params.get("dest"), params.get("mode"))
+        content = params.get('content').encode()
+        mode = self._parse_mode(params.get("mode"), 'copy')
+        try:
+            st = os.stat(params.get("dest"))
+        except FileNotFoundError:
+            st = None
+
+        if st is not None:
+            if not params.get("force", False):
+                return False, "The specified destination path exists: {}".format(params.get("dest"))
 
-            return True, None
+            if self._is_unchanged(params.get("dest"), st, content, mode):
+                return False, "The destination already has the specified content: {}".format(params.get("dest"))
 
+        self._atomic_write(params.get("dest"), content, mode)
+        return True, None
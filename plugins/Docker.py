@@ -5,71 +5,98 @@ import katanaerrors
 
 class Docker(Plugin):
 
+    client = None
+    service_running = None
+
     @classmethod
     def get_aliases(cls):
         return ["docker"]
 
+    @classmethod
+    def get_client(cls):
+        if Docker.client is None:
+            Docker.client = docker.DockerClient(base_url='unix://var/run/docker.sock')
+        return Docker.client
+
+    @classmethod
+    def is_service_running(cls):
+        # The started and exists checks both need this for every docker module, so one probe serves a status() call.
+        if Docker.service_running is None:
+            Docker.service_running = cls._service_status('docker') == 0
+        return Docker.service_running
+
+    @classmethod
+    def forget_service_status(cls):
+        Docker.service_running = None
+
+    @classmethod
+    def find_container(cls, name):
+        # The 'name' filter is a substring match on the daemon side. Prefer an exact match, but fall back to the
+        # first hit so swarm/compose containers (e.g. 'wayfarer_wayfarer-db.1.<task>') are still found.
+        container_list = cls.get_client().containers.list(filters={'name': name}, all=True)
+        for container in container_list:
+            if container.name == name:
+                return container
+        return container_list[0] if len(container_list) > 0 else None
+
     def install(self, params):
         self._validate_params(params, ['name', 'image'], 'docker')
-        client = docker.DockerClient(base_url='unix://var/run/docker.sock')
-
-        container_list = client.containers.list(filters={'name': params.get('name')}, all=True)
+        client = self.get_client()
 
-        port_mappings = {}
-        for container_port in params.get('ports').keys():
-            port_mappings[container_port] = ('127.0.0.1', params.get('ports').get(container_port))
+        port_mappings = {container_port: ('127.0.0.1', host_port)
+                         for container_port, host_port in (params.get('ports') or {}).items()}
 
-        if len(container_list) > 0:
+        if self.find_container(params.get('name')) is not None:
             return False, "A container named '{}' is already installed.".format(params.get('name'))
         else:
-            images = client.images.list(name=params.get('image'))
-            if len(images) == 0:
+            try:
+                client.images.get(params.get('image'))
+            except docker.errors.ImageNotFound:
                 print("       Image not available locally. Pulling from DockerHub.")
-                client.images.pull(params.get('image'))
+                # Without a tag older docker-py releases pull every tag of the repository.
+                repository, tag = docker.utils.parse_repository_tag(params.get('image'))
+                client.images.pull(repository, tag=tag or 'latest')
 
-            container = client.containers.create(image=params.get('image'), name=params.get('name'), detach=True,
-                                                 ports=port_mappings)
-            container.logs()
+            client.containers.create(image=params.get('image'), name=params.get('name'), detach=True,
+                                     ports=port_mappings)
             return True, None
 
-    def remove(self, params):
+    def _get_container(self, params, action, running=None):
         self._validate_params(params, ['name'], 'docker')
-        client = docker.DockerClient(base_url='unix://var/run/docker.sock')
-        container_list = client.containers.list(filters={'name': params.get('name')}, all=True)
+        container = self.find_container(params.get('name'))
+
+        if container is None:
+            return None, "No container named '{}' was found. It will need to be installed before you can {} it.".format(
+                params.get('name'), action)
+        elif running is True and container.status != "running":
+            return None, "The '{}' container is not running.".format(params.get('name'))
+        elif running is False and container.status == "running":
+            return None, "The '{}' container is already running.".format(params.get('name'))
+        else:
+            return container, None
 
-        if len(container_list) == 0:
-            return False, "No container named '{}' was found. It will need to be installed before you can remove it.".format(
-                params.get('name'))
-        elif container_list[0].status == "running":
+    def remove(self, params):
+        container, msg = self._get_container(params, 'remove')
+        if container is None:
+            return False, msg
+        elif container.status == "running":
             raise katanaerrors.CriticalFunctionFailure('docker', 'Cannot remove a running container.')
         else:
-            container_list[0].remove(v=True)
+            container.remove(v=True)
             return True, "Container removed: '{}".format(params.get('name'))
 
     def start(self, params):
-        self._validate_params(params, ['name'], 'docker')
-        client = docker.DockerClient(base_url='unix://var/run/docker.sock')
-        container_list = client.containers.list(filters={'name': params.get('name')}, all=True)
-
-        if len(container_list) == 0:
-            return False, "No container named '{}' was found. It will need to be installed before you can start it.".format(
-                params.get('name'))
-        elif container_list[0].status == "running":
-            return False, "The '{}' container is already running.".format(params.get('name'))
+        container, msg = self._get_container(params, 'start', running=False)
+        if container is None:
+            return False, msg
         else:
-            container_list[0].start()
+            container.start()
             return True, None
 
     def stop(self, params):
-        self._validate_params(params, ['name'], 'docker')
-        client = docker.DockerClient(base_url='unix://var/run/docker.sock')
-        container_list = client.containers.list(filters={'name': params.get('name')}, all=True)
-
-        if len(container_list) == 0:
-            return False, "No container named '{}' was found. It will need to be installed before you can stop it.".format(
-                params.get('name'))
-        elif container_list[0].status != "running":
-            return False, "The '{}' container is not running.".format(params.get('name'))
+        container, msg = self._get_container(params, 'stop', running=True)
+        if container is None:
+            return False, msg
         else:
-            container_list[0].stop()
+            container.stop()
             return True, None
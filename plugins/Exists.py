@@ -1,7 +1,5 @@
-from plugins import Plugin
+from plugins import Plugin, Docker
 import os.path
-import subprocess
-import docker
 import katanaerrors
 
 
@@ -15,14 +13,10 @@ class Exists(Plugin):
         return os.path.exists(value)
 
     def service(self, value):
-        return_code = subprocess.call(['systemctl', 'status', value, '--no-pager'])
-        return return_code != 4
+        return self._service_status(value) != 4
 
     def docker(self, value):
-        if subprocess.call(['systemctl', 'status', 'docker', '--no-pager']) == 0:
-            client = docker.DockerClient(base_url='unix://var/run/docker.sock')
-            container_list = client.containers.list(filters={'name': value}, all=True)
-
-            return len(container_list) > 0
+        if Docker.is_service_running():
+            return Docker.find_container(value) is not None
         else:
             raise katanaerrors.BlockedByDependencyException('docker')
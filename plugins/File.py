@@ -23,7 +23,7 @@ class File(Plugin):
                     os.makedirs(params.get('path'))
                     return True, None
                 else:
-                    os.makedirs(params.get('path'), mode=params.get('mode'))
+                    os.makedirs(params.get('path'), mode=self._parse_mode(params.get('mode'), 'file'))
                     return True, None
             except FileExistsError as err:
                 return False, 'Specified path exists.'
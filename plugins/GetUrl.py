@@ -1,29 +1,74 @@
 from plugins import Plugin, Unarchive
-import requests
+import functools
+import json
 import os
 import os.path
 import re
+import shutil
 from urllib.parse import urlparse
+from urllib.request import url2pathname
 import katanaerrors
 
 
+@functools.lru_cache(maxsize=128)
+def _compile(pattern):
+    return re.compile(pattern)
+
+
 def _get_link_from_page(url, link_pattern):
-    response = requests.get(url)
-    print("Fetched response as code={}".format(response.status_code))
-    urls = re.findall(link_pattern, response.text)
+    # Match on the raw body so requests never has to guess the page's charset; only the hit gets decoded.
+    if isinstance(link_pattern, str):
+        link_pattern = _compile(link_pattern.encode())
+
+    with Plugin.get_session().get(url, stream=True, timeout=(5, 30)) as response:
+        print("Fetched response as code={}".format(response.status_code))
+        # Release pages run to megabytes; stop reading at the first line that matches.
+        match = next((m for line in response.iter_lines() for m in link_pattern.findall(line)), None)
+        page_url = response.url
 
-    print("URLs {}".format(urls))
+    link = match.decode() if match is not None else None
+    print("URL {}".format(link))
 
-    if len(urls) > 0:
-        if urls[0].startswith("http"):
-            return urls[0]
+    if link is not None:
+        if link.startswith("http"):
+            return link
         else:
-            parsed_uri = urlparse(response.url)
-            return '{}://{}{}'.format(parsed_uri.scheme, parsed_uri.netloc, urls[0])
+            parsed_uri = urlparse(page_url)
+            return '{}://{}{}'.format(parsed_uri.scheme, parsed_uri.netloc, link)
 
     else:
-        print(response.text)
-        raise katanaerrors.CriticalFunctionFailure('get_url', 'Could not find link pattern in resulting page.')
+        raise katanaerrors.CriticalFunctionFailure('get_url', 'Could not find link pattern in resulting page: {}'.format(url))
+
+
+def _conditional_headers(dest):
+    # The sidecar is only trusted while dest is exactly the file a complete download left behind, so a truncated
+    # or locally edited copy is fetched again instead of being validated by the server.
+    try:
+        with open(dest + '.etag') as sidecar:
+            saved = json.load(sidecar)
+        st = os.stat(dest)
+    except (OSError, ValueError):
+        return {}
+    if saved.get('size') != st.st_size or saved.get('mtime_ns') != st.st_mtime_ns:
+        return {}
+
+    headers = {}
+    if saved.get('etag') is not None:
+        headers['If-None-Match'] = saved.get('etag')
+    if saved.get('last_modified') is not None:
+        headers['If-Modified-Since'] = saved.get('last_modified')
+    return headers
+
+
+def _save_validators(dest, response):
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag is None and last_modified is None:
+        return
+    st = os.stat(dest)
+    with open(dest + '.etag', 'w') as sidecar:
+        json.dump({'etag': etag, 'last_modified': last_modified, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns},
+                  sidecar)
 
 
 class GetUrl(Plugin):
@@ -34,9 +79,11 @@ class GetUrl(Plugin):
 
     def any(self, params):
         self._validate_params(params, ['url', 'dest'], 'get_url')
+        dest = params.get('dest')
+        dest_exists = os.path.exists(dest)
 
-        if os.path.exists(params.get('dest')) and not params.get('overwrite', False):
-            return False, 'The specified file already exists: {}'.format(params.get('dest'))
+        if dest_exists and not params.get('overwrite', False):
+            return False, 'The specified file already exists: {}'.format(dest)
         else:
             link_pattern = params.get('link_pattern')
 
@@ -47,15 +94,31 @@ class GetUrl(Plugin):
 
             if url.endswith('.tgz') or url.endswith('.tar.gz'):
                 unarch_plugin = Unarchive()
-                unarch_params = {'url': url, 'dest' : params.get('dest')}
+                unarch_params = {'url': url, 'dest' : dest}
                 return unarch_plugin.any(unarch_params)
             else:
                 print("      Downloading {}...".format(url))
 
-                r = requests.get(url, stream=True)
+                parsed_url = urlparse(url)
+                if parsed_url.scheme in ('', 'file'):
+                    # Local mirror: shutil.copyfile uses os.sendfile on Linux, so the bytes never pass through Python.
+                    shutil.copyfile(url2pathname(parsed_url.path), dest)
+                    return True, None
+
+                # Only reached with overwrite set; let the server skip the body if our copy is current.
+                headers = _conditional_headers(dest) if dest_exists else {}
 
-                with open(params.get("dest"), "wb") as output:
-                    for chunk in r.iter_content(chunk_size=1024):
-                        if chunk:
-                            output.write(chunk)
+                with self.get_session().get(url, stream=True, timeout=(5, 60), headers=headers) as r:
+                    if r.status_code == 304:
+                        return False, 'The specified file is already up to date: {}'.format(dest)
+                    # Forget the old validators before dest is touched, so an interrupted download is never trusted.
+                    try:
+                        os.remove(dest + '.etag')
+                    except FileNotFoundError:
+                        pass
+                    with open(dest, "wb") as output:
+                        r.raw.decode_content = True
+                        shutil.copyfileobj(r.raw, output, length=1024 * 1024)
+                    if r.status_code == 200:
+                        _save_validators(dest, r)
                 return True, None
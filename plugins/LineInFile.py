@@ -28,14 +28,12 @@ class LineInFile(Plugin):
                 return False, "Line is already present."
             else:
                 lines.remove(line)
-                with open(params.get('dest'), 'w') as f:
-                    f.writelines(lines)
+                self._atomic_write(params.get('dest'), ''.join(lines).encode())
                 return True, None
         else:
             if state == "present":
                 lines.append(line)
-                with open(params.get('dest'), 'w') as f:
-                    f.writelines(lines)
+                self._atomic_write(params.get('dest'), ''.join(lines).encode())
                 return True, None
             else:
                 return False, "Line is already not present."
@@ -1,13 +1,126 @@
 import katanaerrors
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
+import errno
+import os
+import stat
+import subprocess
+import tempfile
 
 
 class Plugin(object):
+    session = None
 
     def _validate_params(self, params, required_params, plugin_name):
         for key in required_params:
             if params is None or key not in params.keys():
                 raise katanaerrors.MissingRequiredParam(key, plugin_name)
 
+    @staticmethod
+    def _parse_mode(mode, plugin_name):
+        # Quoted YAML modes such as '0644' arrive as strings; read them as octal rather than decimal.
+        if isinstance(mode, str):
+            try:
+                return int(mode, 8)
+            except ValueError:
+                raise katanaerrors.UnrecognizedParamValue('mode', mode, plugin_name, 'an octal mode such as 0644')
+        return mode
+
+    @staticmethod
+    def _umask():
+        # os.umask can only be read by setting it, so prefer /proc and avoid racing the server's worker threads.
+        try:
+            with open('/proc/self/status') as status:
+                for line in status:
+                    if line.startswith('Umask:'):
+                        return int(line.split()[1], 8)
+        except OSError:
+            pass
+        umask = os.umask(0o022)
+        os.umask(umask)
+        return umask
+
+    @staticmethod
+    def _copy_xattrs(src, fd):
+        # Carry labels such as security.selinux over to the replacement file.
+        if not hasattr(os, 'listxattr'):
+            return
+        try:
+            names = os.listxattr(src)
+        except OSError as err:
+            if err.errno not in (errno.ENOTSUP, errno.ENODATA, errno.EINVAL):
+                raise
+            return
+        for name in names:
+            try:
+                os.setxattr(fd, name, os.getxattr(src, name))
+            except OSError as err:
+                if err.errno not in (errno.EPERM, errno.EACCES, errno.ENOTSUP, errno.ENODATA, errno.EINVAL):
+                    raise
+
+    @staticmethod
+    def _write_in_place(path, data, mode):
+        with open(path, 'wb') as out_file:
+            os.fchmod(out_file.fileno(), mode)
+            out_file.write(data)
+
+    @staticmethod
+    def _atomic_write(path, data, mode=None):
+        # Write a private temp file beside the target, flush it to disk, then rename it over the target so readers
+        # never see a half-written file.
+        path = os.path.realpath(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            st = None
+        if mode is None:
+            mode = stat.S_IMODE(st.st_mode) if st is not None else 0o666 & ~Plugin._umask()
+
+        # Renaming would split a hardlinked target from its other names, so rewrite those in place.
+        if st is not None and st.st_nlink > 1:
+            Plugin._write_in_place(path, data, mode)
+            return
+
+        # mkstemp uses an unpredictable name and O_EXCL, so a planted symlink can't redirect the write.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.{}.'.format(os.path.basename(path)))
+        try:
+            with os.fdopen(fd, 'wb') as out_file:
+                if st is not None:
+                    os.fchown(fd, st.st_uid, st.st_gid)
+                    Plugin._copy_xattrs(path, fd)
+                # After fchown, which can clear setuid/setgid bits.
+                os.fchmod(fd, mode)
+                out_file.write(data)
+                out_file.flush()
+                os.fsync(fd)
+            os.replace(tmp_path, path)
+        except OSError as err:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            # A bind-mounted target (e.g. /etc/hosts in a container) cannot be renamed over; write it in place.
+            if err.errno not in (errno.EBUSY, errno.EXDEV):
+                raise
+            Plugin._write_in_place(path, data, mode)
+
+    @staticmethod
+    def _service_status(name):
+        # Only the exit code matters: 0 running, 3 stopped, 4 no such unit. --lines=0 skips the journal read.
+        return subprocess.call(['systemctl', 'status', name, '--no-pager', '--lines=0'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    @classmethod
+    def get_session(cls):
+        # One session for every download, so retries and pooled connections are shared by get_url and unarchive.
+        if Plugin.session is None:
+            adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3))
+            Plugin.session = requests.Session()
+            Plugin.session.mount('http://', adapter)
+            Plugin.session.mount('https://', adapter)
+            atexit.register(Plugin.session.close)
+        return Plugin.session
+
     @classmethod
     def get_aliases(cls):
         return [cls.__name__]
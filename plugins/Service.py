@@ -14,7 +14,7 @@ class Service(Plugin):
         if params.get('state') not in ['running', 'stopped', 'restarted']:
             raise katanaerrors.UnrecognizedParamValue('state', params.get('state'), 'service', 'running, stopped, restarted')
 
-        status_code = subprocess.call(['systemctl', 'status', params.get('name'), '--no-pager'])
+        status_code = self._service_status(params.get('name'))
 
         if status_code == 4:
             raise katanaerrors.CriticalFunctionFailure('service', 'The specified service could not be found: {}'.format(params.get('name')))
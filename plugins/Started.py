@@ -1,7 +1,4 @@
-from plugins import Plugin
-import os.path
-import docker
-import subprocess
+from plugins import Plugin, Docker
 
 
 class Started(Plugin):
@@ -11,20 +8,11 @@ class Started(Plugin):
         return ["started"]
 
     def service(self, value):
-        result = subprocess.run(['systemctl', 'status', value, '--no-pager'], text=True)
-        if result.returncode != 0:
-            print(result.stderr)
-        return result.returncode == 0
-        # return subprocess.call(['systemctl', 'status', value]) == 0
+        return self._service_status(value) == 0
 
     def docker(self, value):
-        if not self.service("docker"):
+        if not Docker.is_service_running():
             return False
 
-        client = docker.DockerClient(base_url='unix://var/run/docker.sock')
-        container_list = client.containers.list(filters={'name': value}, all=True)
-
-        if len(container_list) == 0:
-            return False
-        else:
-            return container_list[0].status == "running"
+        container = Docker.find_container(value)
+        return container is not None and container.status == "running"
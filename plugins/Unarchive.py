@@ -1,9 +1,10 @@
 from plugins import Plugin
 import os.path
-import requests
 import re
-from tarfile import TarFile
+import shutil
 import tarfile
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 class Unarchive(Plugin):
 
@@ -17,23 +18,26 @@ class Unarchive(Plugin):
         # if os.path.exists(params.get('dest')) and not params.get('overwrite', False):
         #     return False, 'The specified file already exists: {}'.format(params.get('dest'))
         # else:
-        r = requests.get(params.get('url'), stream=True)
-
-        cd = r.headers['content-disposition']
-        if cd is not None and len(cd) > 0:
-            temp_file_name = '/tmp/{}'.format(re.findall("filename=(.+)", cd)[0])
+        parsed_url = urlparse(params.get('url'))
+        if parsed_url.scheme in ('', 'file'):
+            # Local mirror: extract straight from the archive, there is nothing to download.
+            temp_file_name = url2pathname(parsed_url.path)
         else:
-            temp_file_name = '/tmp/tempdownload.tar.gz'
+            with self.get_session().get(params.get('url'), stream=True, timeout=(5, 60)) as r:
+                cd = r.headers['content-disposition']
+                if cd is not None and len(cd) > 0:
+                    temp_file_name = '/tmp/{}'.format(re.findall("filename=(.+)", cd)[0])
+                else:
+                    temp_file_name = '/tmp/tempdownload.tar.gz'
 
-        if not os.path.exists(temp_file_name):
-            with open(temp_file_name, "wb") as output:
-                for chunk in r.iter_content(chunk_size=1024):
-                    if chunk:
-                        output.write(chunk)
+                if os.path.exists(temp_file_name):
+                    return False, "The file '{}' already exists, so this task was skipped.".format(temp_file_name)
 
-            tar = tarfile.open(temp_file_name)
-            tar.extractall(path=params.get('dest'))
-            tar.close()
-            return True, None
-        else:
-            return False, "The file '{}' already exists, so this task was skipped.".format(temp_file_name)
+                with open(temp_file_name, "wb") as output:
+                    r.raw.decode_content = True
+                    shutil.copyfileobj(r.raw, output, length=1024 * 1024)
+
+        tar = tarfile.open(temp_file_name)
+        tar.extractall(path=params.get('dest'))
+        tar.close()
+        return True, None
@@ -1,9 +1,5 @@
 from plugins import Command
 
-import subprocess
-import os.path
-import os
-
 
 class Yarn(Command):
 
@@ -1,5 +1,5 @@
 from os import listdir
-from os.path import abspath, realpath, join, dirname, isfile
+from os.path import abspath, realpath, join, dirname
 
 from plugins import Plugin
 
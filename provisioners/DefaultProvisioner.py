@@ -1,6 +1,10 @@
 from provisioners import BaseProvisioner
+from plugins import Docker
 import katanacore
 import katanaerrors
+import logging
+
+log = logging.getLogger(__name__)
 
 
 class DefaultProvisioner(BaseProvisioner.BaseProvisioner):
@@ -84,18 +88,18 @@ class DefaultProvisioner(BaseProvisioner.BaseProvisioner):
         """
         status_checks = self.module_info.get('status', {})
 
-        print("checking status for {}".format(status_checks))
+        log.debug("checking status for %s", status_checks)
 
         try:
             has_run_check = False
             if 'running' in status_checks:
                 has_run_check = True
-                print("doing running check...")
+                log.debug("doing running check...")
                 if self._do_checks(status_checks.get('running')) == 0:
                     return 'running'
 
             if 'installed' in status_checks:
-                print("doing installed check...")
+                log.debug("doing installed check...")
                 if self._do_checks(status_checks.get('installed')) == 0:
                     if has_run_check:
                         return "stopped"
@@ -107,17 +111,20 @@ class DefaultProvisioner(BaseProvisioner.BaseProvisioner):
                 return "unknown"
         except katanaerrors.BlockedByDependencyException:
             return "blocked"
+        finally:
+            # Docker may be started or stopped between calls, so the service probe must not outlive this one.
+            Docker.forget_service_status()
 
     def _do_checks(self, checks):
         failed_checks = 0
         for check_type in checks.keys():
             check_pair = checks.get(check_type)
-            print("Check pair: {}".format(check_pair))
+            log.debug("Check pair: %s", check_pair)
             for check_key in check_pair.keys():
                 check_value = check_pair.get(check_key)
-                print("found check '{}' with value '{}'.".format(check_key, check_value))
+                log.debug("found check '%s' with value '%s'.", check_key, check_value)
                 check_plugin = BaseProvisioner.BaseProvisioner.get_plugin(check_type)
-                print("check plugin: {}".format(check_plugin))
+                log.debug("check plugin: %s", check_plugin)
                 if check_plugin is None:
                     raise katanaerrors.NotImplemented(check_type, 'DefaultProvisioner', self.module_info.get('name'))
                 elif hasattr(check_plugin, check_key) and callable(getattr(check_plugin, check_key)):